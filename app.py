@@ -1,11 +1,23 @@
+import gzip
+import os
+
 import dash
 from dash import dcc, html
+from flask import Response, abort, request
 import plotly.graph_objects as go
-import pandas as pd
+import plotly.io as pio
 import numpy as np
 
 # Initialize the Dash app
-app = dash.Dash(__name__)
+# Assets are served locally and compressed; update_title=None keeps the tab title
+# from flickering to "Updating..." on every callback
+app = dash.Dash(__name__, serve_locally=True, compress=True, update_title=None,
+                suppress_callback_exceptions=True, assets_ignore=r'.*\.map')
+
+# WSGI entry point for production, e.g.
+#   gunicorn app:server --preload -w 4 -k gthread --threads 8
+# --preload builds the figures once in the master process and shares them with the workers
+server = app.server
 
 # Radiation exposure data (in millisieverts, mSv)
 radiation_sources = {
@@ -19,17 +31,143 @@ radiation_sources = {
     "Fukushima Evacuation Zone (Annual)": 12.0,
 }
 
-df = pd.DataFrame(list(radiation_sources.items()), columns=["Source", "Dose (mSv)"])
+SOURCES = tuple(radiation_sources.keys())
+DOSES = tuple(radiation_sources.values())
 
 # LNT vs. Threshold vs. Hormesis Models
-dose_values = np.linspace(0, 100, 100)
-lnt_risk = dose_values * 0.01
-threshold_risk = np.piecewise(dose_values, [dose_values < 10, dose_values >= 10], [0, lambda x: (x - 10) * 0.01])
-hormesis_risk = np.piecewise(dose_values, [dose_values < 10, dose_values >= 10],
-                             [lambda x: -0.005 * x + 0.05, lambda x: (x - 10) * 0.01])
+# Fills the three preallocated curves in place so the models can be recomputed
+# for other thresholds or slopes without allocating new arrays
+def compute_risks(dose, threshold, hormesis_slope, out_lnt, out_threshold, out_hormesis):
+    np.multiply(dose, 0.01, out=out_lnt)
+    np.subtract(dose, threshold, out=out_threshold)
+    np.maximum(out_threshold, 0.0, out=out_threshold)
+    np.multiply(out_threshold, 0.01, out=out_threshold)
+    np.multiply(dose, hormesis_slope, out=out_hormesis)
+    np.add(out_hormesis, 0.05, out=out_hormesis)
+    np.copyto(out_hormesis, out_threshold, where=dose >= threshold)
+
+dose_values = np.linspace(0, 100, 100, dtype=np.float32)
+# One contiguous (model, dose) matrix: rows are LNT, Threshold and Hormesis
+RISK = np.empty((3, dose_values.size), dtype=np.float32)
+compute_risks(dose_values, 10, -0.005, RISK[0], RISK[1], RISK[2])
+
+# Serialize figures (including the Dash layout and fig/<name> payloads) with orjson
+pio.json.config.default_engine = 'orjson'
+
+# Shared figure styling, registered once and layered on the default plotly template by name
+pio.templates['radiation'] = go.layout.Template(data=dict(bar=[go.Bar(marker_color='blue')]))
+
+# Figures are built once at import so each page load reuses the validated objects
+BAR_FIG = go.Figure(
+    data=[go.Bar(x=SOURCES, y=DOSES)],
+    layout=go.Layout(title="Radiation Dose Comparison (mSv)", xaxis_title="Source",
+                     yaxis_title="Dose (mSv)", template='plotly+radiation')
+)
+
+MODELS_FIG = go.Figure(
+    data=[
+        go.Scattergl(x=dose_values, y=RISK[0], mode='lines', name='Linear No-Threshold (LNT)',
+                     line=dict(color='red')),
+        go.Scattergl(x=dose_values, y=RISK[1], mode='lines', name='Threshold Model',
+                     line=dict(color='blue', dash='dash')),
+        go.Scattergl(x=dose_values, y=RISK[2], mode='lines', name='Hormesis Model',
+                     line=dict(color='green', dash='dot')),
+    ],
+    layout=go.Layout(title="Radiation Dose-Response Models", xaxis_title="Radiation Dose (mSv)",
+                     yaxis_title="Relative Risk", template='plotly+radiation')
+)
+
+# Slider marks for the calculator
+FLIGHT_MARKS = {i: str(i) for i in range(0, 51, 10)}
+XRAY_MARKS = {i: str(i) for i in range(0, 11)}
+
+# Charts are loaded into these sections once they scroll into view
+LAZY_SECTIONS = ['exposure', 'models']
+
+# Each figure is serialized and gzipped once, then served as-is from fig/<name>
+# under the app's path prefix
+FIG_JSON = {'exposure': BAR_FIG.to_json(), 'models': MODELS_FIG.to_json()}
+FIG_JSON_GZIP = {name: gzip.compress(fig_json.encode()) for name, fig_json in FIG_JSON.items()}
+FIG_URLS = {name: app.config.requests_pathname_prefix + f'fig/{name}' for name in FIG_JSON}
+
+@app.server.route(app.config.routes_pathname_prefix + 'fig/<name>')
+def serve_figure(name):
+    if name not in FIG_JSON:
+        abort(404)
+    if 'gzip' in request.accept_encodings:
+        return Response(FIG_JSON_GZIP[name], headers={'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'},
+                        mimetype='application/json')
+    return Response(FIG_JSON[name], headers={'Vary': 'Accept-Encoding'}, mimetype='application/json')
+
+# The layout and callback graph never change at runtime, so let browsers and
+# proxies revalidate them with an ETag instead of downloading them again
+STATIC_DASH_ROUTES = {app.config.routes_pathname_prefix + route
+                      for route in ('_dash-layout', '_dash-dependencies')}
+
+def _cache_publicly(response):
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response
+
+@app.server.after_request
+def add_etag(response):
+    # Skipped in debug mode so hot reload never sees a cached layout
+    if request.path not in STATIC_DASH_ROUTES or response.status_code != 200 or app.server.debug:
+        return response
+    response.add_etag()
+    _cache_publicly(response)
+    # Flask-Compress runs after this hook and appends ":<encoding>" to the ETag,
+    # so compare the client's validators without that suffix
+    etag, _ = response.get_etag()
+    for client_etag in request.if_none_match.as_set(include_weak=True):
+        if client_etag.partition(':')[0] == etag:
+            not_modified = Response(status=304)
+            not_modified.set_etag(client_etag)
+            return _cache_publicly(not_modified)
+    return response
+
+# FAQ entries, built into their Details components once at import
+FAQ = [
+    ("What is a millisievert (mSv)?",
+     "A millisievert (mSv) is a unit used to measure radiation dose and assess potential health risks from exposure."),
+    ("Is background radiation harmful?",
+     "Background radiation is naturally occurring and typically not harmful at normal exposure levels. "
+     "It comes from sources like cosmic rays and the Earth's crust."),
+    ("What is the LNT model?",
+     "The Linear No-Threshold (LNT) model assumes that all radiation exposure, no matter how small, "
+     "increases the risk of cancer and other health effects."),
+    ("How much radiation is considered dangerous?",
+     "Acute exposure above 1,000 mSv (1 Sv) can cause radiation sickness, while prolonged exposure "
+     "above 100 mSv may increase cancer risk. However, small doses from medical imaging or flights "
+     "are generally not dangerous."),
+    ("Does flying frequently increase radiation exposure?",
+     "Yes, but the exposure is minimal. A round-trip flight from NYC to LA results in about 0.08 mSv of exposure, "
+     "which is much lower than an annual background dose (3 mSv)."),
+    ("Is radiation from medical imaging safe?",
+     "Medical imaging, such as X-rays and CT scans, involves low radiation doses that are carefully controlled. "
+     "The benefits usually outweigh the risks when performed by medical professionals."),
+    ("What is the difference between ionizing and non-ionizing radiation?",
+     "Ionizing radiation (e.g., X-rays, gamma rays) can remove electrons from atoms, potentially causing damage to cells. "
+     "Non-ionizing radiation (e.g., radio waves, microwaves) does not have enough energy to ionize atoms and is generally safer."),
+    ("What is radiation hormesis?",
+     "Radiation hormesis is the hypothesis that low levels of radiation exposure may have beneficial effects, "
+     "such as stimulating cellular repair mechanisms. This idea is debated and not widely accepted in radiation safety."),
+    ("Where can I find reliable information on radiation?",
+     "Reliable sources include the Health Physics Society, International Commission on Radiological Protection (ICRP), "
+     "National Council on Radiation Protection and Measurements (NCRP), and BEIR VII reports."),
+    ("Does radiation exposure always cause cancer?",
+     "Not necessarily. While high doses of radiation can increase cancer risk, small doses from background radiation, "
+     "medical imaging, or air travel are unlikely to cause harm."),
+]
+
+FAQ_ITEMS = [html.Details([html.Summary(question), html.P(answer)]) for question, answer in FAQ]
 
 # Layout for the app
 app.layout = html.Div([
+    dcc.Store(id='lazy-sections', data=LAZY_SECTIONS),
+    dcc.Store(id='figure-urls', data=FIG_URLS),
+    *[dcc.Store(id=f'{section}-visible', data=False) for section in LAZY_SECTIONS],
+
     html.H1("Understanding Radiation Exposure and Risk", style={'textAlign': 'center'}),
     html.H5("Created by Mahde Abusaleh", style={'textAlign': 'center', 'marginBottom': 20, 'color': 'gray'}),
 
@@ -42,31 +180,11 @@ html.Div([
     html.A('Conclusion', href='#conclusion', style={'cursor': 'pointer', 'textDecoration': 'none'})
 ], style={'textAlign': 'center', 'marginBottom': 20}),
 
-# JavaScript for smooth scrolling
-dcc.Markdown("""
-    <script>
-    document.addEventListener('DOMContentLoaded', function() {
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
-            anchor.addEventListener('click', function(e) {
-                e.preventDefault();
-                const targetId = this.getAttribute('href').substring(1);
-                document.getElementById(targetId).scrollIntoView({ behavior: 'smooth' });
-            });
-        });
-    });
-    </script>
-""", dangerously_allow_html=True),
 
     # Radiation Exposure Section
     html.Div(id='exposure', children=[
         html.H3("Radiation Exposure from Common Sources"),
-        dcc.Graph(
-            figure={
-                "data": [go.Bar(x=df["Source"], y=df["Dose (mSv)"], marker_color='blue')],
-                "layout": go.Layout(title="Radiation Dose Comparison (mSv)", xaxis_title="Source",
-                                    yaxis_title="Dose (mSv)")
-            }
-        ),
+        html.Div(id='exposure-chart', children=dcc.Loading(dcc.Graph(id='exposure-graph'))),
         html.P("The chart above compares radiation doses from common sources, providing insight into "
                "relative exposure levels."),
     ]),
@@ -74,20 +192,7 @@ dcc.Markdown("""
     # Dose-Response Models Section
     html.Div(id='models', children=[
         html.H3("Dose-Response Models: LNT vs. Threshold vs. Hormesis"),
-        dcc.Graph(
-            figure={
-                "data": [
-                    go.Scatter(x=dose_values, y=lnt_risk, mode='lines', name='Linear No-Threshold (LNT)',
-                               line=dict(color='red')),
-                    go.Scatter(x=dose_values, y=threshold_risk, mode='lines', name='Threshold Model',
-                               line=dict(color='blue', dash='dash')),
-                    go.Scatter(x=dose_values, y=hormesis_risk, mode='lines', name='Hormesis Model',
-                               line=dict(color='green', dash='dot')),
-                ],
-                "layout": go.Layout(title="Radiation Dose-Response Models", xaxis_title="Radiation Dose (mSv)",
-                                    yaxis_title="Relative Risk")
-            }
-        ),
+        html.Div(id='models-chart', children=dcc.Loading(dcc.Graph(id='models-graph'))),
         html.P("The Linear No-Threshold (LNT) model assumes all radiation exposure carries some risk, no matter how "
                "small, while the Threshold model assumes there is a dose below which there is no risk. "
                "The Hormesis model proposes that low levels of radiation may be beneficial."),
@@ -97,75 +202,16 @@ dcc.Markdown("""
     html.Div(id='calculator', children=[
         html.H3("Personal Radiation Exposure Calculator"),
         html.Label("Number of flights per year (NYC to LA equivalent):"),
-        dcc.Slider(0, 50, 1, value=5, marks={i: str(i) for i in range(0, 51, 10)}, id='flight-slider'),
+        dcc.Slider(0, 50, 1, value=5, marks=FLIGHT_MARKS, id='flight-slider', updatemode='mouseup'),
         html.Label("Number of chest X-rays per year:"),
-        dcc.Slider(0, 10, 1, value=1, marks={i: str(i) for i in range(0, 11)}, id='xray-slider'),
+        dcc.Slider(0, 10, 1, value=1, marks=XRAY_MARKS, id='xray-slider', updatemode='mouseup'),
         html.Div(id='total-dose-output', style={'fontSize': 20, 'marginTop': 20}),
     ]),
 
   # FAQ Section
 html.Div(id='faq', children=[
     html.H3("Frequently Asked Questions (FAQ)"),
-    
-    html.Details([
-        html.Summary("What is a millisievert (mSv)?"),
-        html.P("A millisievert (mSv) is a unit used to measure radiation dose and assess potential health risks from exposure.")
-    ]),
-    
-    html.Details([
-        html.Summary("Is background radiation harmful?"),
-        html.P("Background radiation is naturally occurring and typically not harmful at normal exposure levels. "
-               "It comes from sources like cosmic rays and the Earth's crust.")
-    ]),
-    
-    html.Details([
-        html.Summary("What is the LNT model?"),
-        html.P("The Linear No-Threshold (LNT) model assumes that all radiation exposure, no matter how small, "
-               "increases the risk of cancer and other health effects.")
-    ]),
-
-    html.Details([
-        html.Summary("How much radiation is considered dangerous?"),
-        html.P("Acute exposure above 1,000 mSv (1 Sv) can cause radiation sickness, while prolonged exposure "
-               "above 100 mSv may increase cancer risk. However, small doses from medical imaging or flights "
-               "are generally not dangerous.")
-    ]),
-
-    html.Details([
-        html.Summary("Does flying frequently increase radiation exposure?"),
-        html.P("Yes, but the exposure is minimal. A round-trip flight from NYC to LA results in about 0.08 mSv of exposure, "
-               "which is much lower than an annual background dose (3 mSv).")
-    ]),
-
-    html.Details([
-        html.Summary("Is radiation from medical imaging safe?"),
-        html.P("Medical imaging, such as X-rays and CT scans, involves low radiation doses that are carefully controlled. "
-               "The benefits usually outweigh the risks when performed by medical professionals.")
-    ]),
-
-    html.Details([
-        html.Summary("What is the difference between ionizing and non-ionizing radiation?"),
-        html.P("Ionizing radiation (e.g., X-rays, gamma rays) can remove electrons from atoms, potentially causing damage to cells. "
-               "Non-ionizing radiation (e.g., radio waves, microwaves) does not have enough energy to ionize atoms and is generally safer.")
-    ]),
-
-    html.Details([
-        html.Summary("What is radiation hormesis?"),
-        html.P("Radiation hormesis is the hypothesis that low levels of radiation exposure may have beneficial effects, "
-               "such as stimulating cellular repair mechanisms. This idea is debated and not widely accepted in radiation safety.")
-    ]),
-
-    html.Details([
-        html.Summary("Where can I find reliable information on radiation?"),
-        html.P("Reliable sources include the Health Physics Society, International Commission on Radiological Protection (ICRP), "
-               "National Council on Radiation Protection and Measurements (NCRP), and BEIR VII reports.")
-    ]),
-
-    html.Details([
-        html.Summary("Does radiation exposure always cause cancer?"),
-        html.P("Not necessarily. While high doses of radiation can increase cancer risk, small doses from background radiation, "
-               "medical imaging, or air travel are unlikely to cause harm.")
-    ]),
+    *FAQ_ITEMS,
 ]),
 
     # References Section
@@ -188,19 +234,34 @@ html.Div(id='faq', children=[
     ]),
 ])
 
+# Watch the chart sections and flag each one as visible when it nears the viewport
+app.clientside_callback(
+    dash.ClientsideFunction(namespace="lazy", function_name="observe"),
+    dash.Input("lazy-sections", "data")
+)
+
+# Fetch each chart's pre-serialized figure once its section is visible
+for section in LAZY_SECTIONS:
+    app.clientside_callback(
+        dash.ClientsideFunction(namespace="lazy", function_name="load_figure"),
+        dash.Output(f"{section}-graph", "figure"),
+        dash.Input(f"{section}-visible", "data"),
+        dash.State(f"{section}-visible", "id"),
+        dash.State("figure-urls", "data"),
+        prevent_initial_call=True
+    )
+
 # Callback for radiation dose calculator
-@app.callback(
+app.clientside_callback(
+    dash.ClientsideFunction(namespace="calculator", function_name="update_dose"),
     dash.Output("total-dose-output", "children"),
     [dash.Input("flight-slider", "value"), dash.Input("xray-slider", "value")]
 )
-def update_dose(flights, xrays):
-    total_dose = (flights * 0.04) + (xrays * 0.1)
-    return f"Your estimated annual radiation dose from selected activities: {total_dose:.2f} mSv"
 
 if __name__ == "__main__":
-    import os
     port = int(os.environ.get("PORT", 8050))
-    app.run_server(debug=True, host="0.0.0.0", port=port)
+    debug = os.environ.get("DEBUG", "0") == "1"
+    app.run_server(debug=debug, host="0.0.0.0", port=port)
 
 
 
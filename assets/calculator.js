@@ -0,0 +1,10 @@
+// Personal radiation exposure calculator, evaluated in the browser so slider
+// changes never need a round-trip to the server.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    calculator: {
+        update_dose: function(flights, xrays) {
+            const totalDose = (flights * 0.04) + (xrays * 0.1);
+            return 'Your estimated annual radiation dose from selected activities: ' + totalDose.toFixed(2) + ' mSv';
+        }
+    }
+});
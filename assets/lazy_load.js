@@ -0,0 +1,34 @@
+// Marks a section as visible once it scrolls near the viewport so its chart
+// is only requested from the server when the user is about to see it, then
+// fetches the pre-serialized figure from the fig/<name> route.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    lazy: {
+        observe: function(sections) {
+            const observer = new IntersectionObserver(function(entries) {
+                entries.forEach(function(entry) {
+                    if (entry.isIntersecting) {
+                        observer.unobserve(entry.target);
+                        window.dash_clientside.set_props(entry.target.id + '-visible', {data: true});
+                    }
+                });
+            }, {rootMargin: '300px'});  // start loading the next section slightly before it is on screen
+
+            sections.forEach(function(id) {
+                const section = document.getElementById(id);
+                if (section) {
+                    observer.observe(section);
+                }
+            });
+        },
+
+        load_figure: async function(visible, storeId, figureUrls) {
+            const name = storeId.replace(/-visible$/, '');
+            const response = await fetch(figureUrls[name]);
+            if (!response.ok) {
+                console.error('Failed to load figure "' + name + '": HTTP ' + response.status);
+                return window.dash_clientside.no_update;
+            }
+            return await response.json();
+        }
+    }
+});
@@ -0,0 +1,13 @@
+// Smooth scrolling for the navigation bar links. The handler is delegated from
+// the document because Dash renders the layout after this script has loaded.
+document.addEventListener('click', function(e) {
+    const anchor = e.target.closest('a[href^="#"]');
+    if (!anchor) {
+        return;
+    }
+    const target = document.getElementById(anchor.getAttribute('href').substring(1));
+    if (target) {
+        e.preventDefault();
+        target.scrollIntoView({ behavior: 'smooth' });
+    }
+});
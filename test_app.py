@@ -0,0 +1,41 @@
+import gzip
+import json
+
+import pytest
+
+from app import FIG_JSON, FIG_URLS, app
+
+COMPRESSED = {'Accept-Encoding': 'gzip, deflate, br, zstd'}
+
+
+@pytest.fixture
+def client():
+    return app.server.test_client()
+
+
+@pytest.mark.parametrize('path', ['/_dash-layout', '/_dash-dependencies'])
+@pytest.mark.parametrize('headers', [COMPRESSED, {'Accept-Encoding': 'identity'}])
+def test_static_dash_routes_revalidate_with_etag(client, path, headers):
+    first = client.get(path, headers=headers)
+    assert first.status_code == 200
+    assert first.headers['Cache-Control'] == 'public, max-age=300'
+
+    second = client.get(path, headers={**headers, 'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 304
+    assert second.headers['ETag'] == first.headers['ETag']
+
+
+def test_static_dash_routes_not_cached_in_debug(client, monkeypatch):
+    monkeypatch.setattr(app.server, 'debug', True)
+    response = client.get('/_dash-layout', headers=COMPRESSED)
+    assert 'ETag' not in response.headers
+    assert 'Cache-Control' not in response.headers
+
+
+def test_figure_route_serves_pre_serialized_json(client):
+    response = client.get(FIG_URLS['models'], headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.data)) == json.loads(FIG_JSON['models'])
+
+    assert client.get(app.config.requests_pathname_prefix + 'fig/unknown').status_code == 404